@@ -0,0 +1,625 @@
+import os
+import re
+import sys
+import time
+import logging
+import asyncio
+import hashlib
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+import aiofiles
+import aiohttp
+import orjson
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, Field
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# print ではなく logging を使い、レベルで出力を絞れるようにする (GENUI_LOG_LEVEL で変更可)
+logging.basicConfig(format="%(levelname)s:     %(message)s")
+log = logging.getLogger("genui")
+log.setLevel(os.environ.get("GENUI_LOG_LEVEL", "INFO"))
+
+class ORJSONResponse(JSONResponse):
+    # レスポンスの JSON 化は orjson で行う
+    def render(self, content):
+        return orjson.dumps(content)
+
+# 保存用ディレクトリ
+LOG_DIR = "generated_logs"
+HISTORY_FILE = os.path.join(LOG_DIR, "history.jsonl") # 1行1件の追記専用ログ
+LEGACY_HISTORY_FILE = os.path.join(LOG_DIR, "history.json")
+
+if not os.path.exists(LOG_DIR):
+    os.makedirs(LOG_DIR)
+
+# 履歴はメモリ上にキャッシュし、追加分はまとめてバックグラウンドで追記する
+HISTORY_FLUSH_INTERVAL = 1.0 # 秒
+HISTORY_FLUSH_BATCH = 10 # この件数が溜まったら待たずに書き込む
+HISTORY_COMPACT_LINES = 1000 # 履歴ファイルがこの行数を超えたら直近100行に詰め直す
+_HISTORY_CACHE = None
+_HISTORY_STAT = None # キャッシュ読み込み時点の履歴ファイルの (mtime, size)
+_HISTORY_LOADED = False # 履歴ファイルを正しく読めたか (読めなかった場合キャッシュは空)
+_pending = deque()
+_HISTORY_LOCK = None
+_dirty = None
+_full = None
+_flusher_task = None
+
+def _init_history_sync():
+    # Lock / Event は実行中のイベントループ上で作る (Python 3.9 では生成時のループに紐付くため)
+    global _HISTORY_LOCK, _dirty, _full
+    _HISTORY_LOCK = asyncio.Lock()
+    _dirty = asyncio.Event()
+    _full = asyncio.Event()
+    if _pending:
+        _dirty.set()
+
+def _migrate_legacy_history():
+    # 旧形式 (history.json, 新しい順の配列) を JSONL (古い順) に変換する (失敗時は例外のまま返す)
+    with open(LEGACY_HISTORY_FILE, "rb") as f:
+        legacy = orjson.loads(f.read())
+    try:
+        # 他のワーカーが先に移行を始めていれば任せる
+        with open(HISTORY_FILE, "xb") as f:
+            f.write(b"".join(orjson.dumps(e) + b"\n" for e in reversed(legacy)))
+    except FileExistsError:
+        return
+    try:
+        os.replace(LEGACY_HISTORY_FILE, LEGACY_HISTORY_FILE + ".bak")
+    except FileNotFoundError:
+        pass
+
+def _read_history_sync():
+    if not os.path.exists(HISTORY_FILE) and os.path.exists(LEGACY_HISTORY_FILE):
+        _migrate_legacy_history()
+    if not os.path.exists(HISTORY_FILE):
+        return []
+    with open(HISTORY_FILE, "rb") as f:
+        lines = deque(f, maxlen=100) # 末尾100行だけ保持
+    history = []
+    for line in reversed(lines):
+        try:
+            history.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue # 書き込み途中の行などは無視
+    return history
+
+def _compact_history_sync():
+    # 末尾100行だけを一時ファイルに書き出し、os.replace で置き換える (詰め直した場合 True)
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return False
+    lines = data.splitlines(keepends=True)
+    if len(lines) <= HISTORY_COMPACT_LINES:
+        return False
+    tmp = f"{HISTORY_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.writelines(lines[-100:])
+    if os.path.getsize(HISTORY_FILE) != len(data):
+        # 読んでいる間に他のワーカーが追記した場合は次の機会に回す
+        os.unlink(tmp)
+        return False
+    os.replace(tmp, HISTORY_FILE)
+    return True
+
+async def _read_history():
+    # 読めなかった場合は None を返し、空の履歴と区別する
+    try:
+        return await asyncio.to_thread(_read_history_sync)
+    except Exception as e:
+        log.error("History load error: %s", e)
+        return None
+
+def _history_stat():
+    try:
+        st = os.stat(HISTORY_FILE)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+async def _ensure_history_loaded():
+    global _HISTORY_CACHE, _HISTORY_STAT, _HISTORY_LOADED
+    stat = _history_stat()
+    # 複数ワーカーで動かす場合、他プロセスが追記していたら読み直す
+    if _HISTORY_CACHE is None or stat != _HISTORY_STAT:
+        _HISTORY_STAT = stat
+        history = await _read_history()
+        _HISTORY_LOADED = history is not None
+        _HISTORY_CACHE = history if _HISTORY_LOADED else []
+    return _HISTORY_CACHE
+
+async def load_history_async():
+    if _HISTORY_LOCK is None:
+        _init_history_sync()
+    async with _HISTORY_LOCK:
+        history = await _ensure_history_loaded()
+        return (list(_pending) + history)[:100]
+
+async def _history_filenames():
+    """ログ掃除用に履歴が参照しているファイル名を返す (履歴を読めなかった場合は None)"""
+    if _HISTORY_LOCK is None:
+        _init_history_sync()
+    async with _HISTORY_LOCK:
+        history = await _ensure_history_loaded()
+        if not _HISTORY_LOADED:
+            return None
+        return {e.get("filename") for e in list(_pending) + history if e.get("filename")}
+
+async def compact_history():
+    global _HISTORY_STAT
+    if _HISTORY_LOCK is None:
+        _init_history_sync()
+    async with _HISTORY_LOCK:
+        fresh = _HISTORY_CACHE is not None and _history_stat() == _HISTORY_STAT
+        try:
+            compacted = await asyncio.to_thread(_compact_history_sync)
+        except Exception as e:
+            log.error("History compaction error: %s", e)
+            return
+        # 直近100件は変わらないので、キャッシュが最新だった場合は読み直さない
+        if compacted and fresh:
+            _HISTORY_STAT = _history_stat()
+
+def save_history(entry):
+    if _dirty is None:
+        _init_history_sync()
+    _pending.appendleft(entry) # 最新を上へ
+    _dirty.set()
+    if len(_pending) >= HISTORY_FLUSH_BATCH:
+        _full.set()
+
+async def flush_history():
+    global _HISTORY_STAT
+    if _HISTORY_LOCK is None:
+        _init_history_sync()
+    async with _HISTORY_LOCK:
+        history = await _ensure_history_loaded()
+        if not _pending:
+            return
+        # 書き込み中に追加された分は左端に積まれるので、右端 (古い方) の n 件だけを書く
+        n = len(_pending)
+        batch = list(_pending)
+        data = b"".join(orjson.dumps(e) + b"\n" for e in reversed(batch))
+        async with aiofiles.open(HISTORY_FILE, "ab") as f:
+            await f.write(data)
+        # 書き込めてからキャッシュへ移す (失敗・キャンセル時は _pending に残して再試行させる)
+        for _ in range(n):
+            _pending.pop()
+        history[:0] = batch
+        del history[100:] # 直近100件
+        if not _pending:
+            _dirty.clear()
+        if len(_pending) < HISTORY_FLUSH_BATCH:
+            _full.clear()
+        _HISTORY_STAT = _history_stat() # 自分の追記では読み直さない
+
+async def _flusher():
+    while True:
+        try:
+            await _dirty.wait()
+            try:
+                await asyncio.wait_for(_full.wait(), timeout=HISTORY_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await flush_history()
+        except Exception as e:
+            log.error("History flush error: %s", e)
+            await asyncio.sleep(HISTORY_FLUSH_INTERVAL)
+
+async def start_history_flusher():
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _init_history_sync()
+        await compact_history()
+        _flusher_task = asyncio.create_task(_flusher())
+
+async def stop_history_flusher():
+    if _flusher_task:
+        _flusher_task.cancel()
+    await flush_history() # 未書き込みの履歴を残さない
+
+# 履歴から外れた古いログ HTML を定期的に削除し、generated_logs の肥大化を防ぐ
+# GENUI_LOG_GC=0 の場合は削除しない (すべてのログを残す)
+LOG_GC_ENABLED = os.environ.get("GENUI_LOG_GC", "1") != "0"
+LOG_GC_INTERVAL = 60 # 秒
+LOG_GC_MIN_AGE = 3600 # 秒 (これより新しいファイルは残す)
+_log_gc_task = None
+
+def _gc_logs_sync(keep):
+    cutoff = time.time() - LOG_GC_MIN_AGE
+    with os.scandir(LOG_DIR) as it:
+        for entry in it:
+            if not (entry.name.startswith("ui_") and entry.name.endswith(".html")):
+                continue
+            if entry.name in keep:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+async def _gc_logs():
+    while True:
+        await asyncio.sleep(LOG_GC_INTERVAL)
+        try:
+            # 未移行の旧履歴がある・履歴を読めない・履歴が空の場合は何も消さない
+            if os.path.exists(LEGACY_HISTORY_FILE):
+                continue
+            await compact_history()
+            keep = await _history_filenames()
+            if not keep:
+                continue
+            await asyncio.to_thread(_gc_logs_sync, keep)
+        except Exception as e:
+            log.error("Log cleanup error: %s", e)
+
+async def start_log_gc():
+    global _log_gc_task
+    if _log_gc_task is None or _log_gc_task.done():
+        _log_gc_task = asyncio.create_task(_gc_logs())
+
+async def stop_log_gc():
+    if _log_gc_task:
+        _log_gc_task.cancel()
+
+# ログ HTML の外枠は起動時に一度だけ組み立てておく
+_HTML_PREFIX = b"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <script src="https://cdn.tailwindcss.com"></script>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
+    <style>body { font-family: 'Inter', sans-serif; }</style>
+</head>
+<body class="p-10 bg-slate-50">
+    """
+_HTML_SUFFIX = b"""
+</body>
+</html>
+"""
+
+# LLM が付けてしまう markdown のコードフェンス (```html / ```)
+_FENCE_RE = re.compile(r"```(?:html)?\n?")
+
+def _write_log(filepath, generated_html):
+    with open(filepath, "wb") as f:
+        f.write(_HTML_PREFIX)
+        f.write(generated_html.encode("utf-8"))
+        f.write(_HTML_SUFFIX)
+
+# LLM クライアントは (api_key, base_url) ごとに使い回し、接続プールを共有する
+MAX_CACHED_CLIENTS = 64
+_http_client = None
+_clients = {}
+
+def get_client(api_key, base_url=None):
+    global _http_client
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        if _http_client is None:
+            _http_client = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+            )
+        if len(_clients) >= MAX_CACHED_CLIENTS:
+            _clients.pop(next(iter(_clients)))
+        client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=_http_client)
+        _clients[key] = client
+    return client
+
+# GENUI_AIOHTTP_MODE=1 の場合、chat.completions は openai SDK を通さず aiohttp で直接呼び出す
+AIOHTTP_MODE = os.environ.get("GENUI_AIOHTTP_MODE", "0") == "1"
+OPENAI_DEFAULT_URL = "https://api.openai.com/v1"
+_aiohttp_session = None
+
+async def start_aiohttp_session():
+    global _aiohttp_session
+    if AIOHTTP_MODE and _aiohttp_session is None:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200, limit_per_host=100, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=600),
+        )
+
+async def close_clients():
+    global _http_client, _aiohttp_session
+    _clients.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
+
+async def open_chat_stream(api_key, llm_url, payload):
+    """chat.completions をストリームで開き、(テキスト断片の async iterator, close 関数) を返す"""
+    if _aiohttp_session is not None:
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        url = (llm_url or OPENAI_DEFAULT_URL).rstrip("/") + "/chat/completions"
+        resp = await _aiohttp_session.post(url, data=orjson.dumps({**payload, "stream": True}), headers=headers)
+        if resp.status >= 400:
+            detail = await resp.text()
+            resp.release()
+            raise RuntimeError(f"Error code: {resp.status} - {detail}")
+
+        async def sse_deltas():
+            # "data: {...}" 形式の Server-Sent Events を1行ずつ読む
+            async for line in resp.content:
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                try:
+                    event = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    log.debug("Skipping non-JSON SSE data: %r", data)
+                    continue
+                # openai SDK と同様、error イベントは例外にする (途中まで生成された HTML を保存しない)
+                if isinstance(event, dict) and event.get("error"):
+                    error = event["error"]
+                    message = error.get("message") if isinstance(error, dict) else None
+                    raise RuntimeError(message or str(error))
+                choices = event.get("choices") if isinstance(event, dict) else None
+                if choices:
+                    text = (choices[0].get("delta") or {}).get("content")
+                    if text:
+                        yield text
+
+        async def close():
+            resp.close()
+
+        return sse_deltas(), close
+
+    # LLM URLが提供されている場合はそれを使用し、そうでなければOpenAIのデフォルトを使用
+    client = get_client(api_key, llm_url or None)
+    response = await client.chat.completions.create(stream=True, **payload)
+
+    async def sdk_deltas():
+        async for chunk in response:
+            if chunk.choices:
+                text = chunk.choices[0].delta.content
+                if text:
+                    yield text
+
+    return sdk_deltas(), response.close
+
+# URLの補正 (schemeがない、または typo への対応)
+_GEMINI_HOST = "generativelanguage.googleapis.com"
+
+def normalize_llm_url(llm_url):
+    if llm_url.startswith(("ttp://", "ttps://")):
+        llm_url = "h" + llm_url # ユーザーの入力ミス (ttps 等) への簡易的な対応
+    elif not llm_url.startswith("http"):
+        llm_url = "http://" + llm_url
+
+    # Google API URL の場合は /openai/ が含まれているかチェック
+    # (プロキシ経由の URL にも対応するため、ホスト名は URL 全体から探す)
+    if _GEMINI_HOST in llm_url and "/openai/" not in llm_url:
+        llm_url += "openai/" if llm_url.endswith("/") else "/openai/"
+        log.debug("Corrected Gemini URL to: %s", llm_url)
+    return llm_url
+
+# モデル一覧はめったに変わらないので、短時間キャッシュしておく
+MODELS_CACHE_TTL = 300 # 秒
+MODELS_CACHE_SIZE = 64
+_models_cache = {}
+
+def _models_cache_key(llm_url, api_key):
+    # API Key そのものはキーに残さずハッシュ化する
+    return (llm_url, hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest())
+
+# ストリーム途中で失敗した場合に末尾へ付けるマーカー (index.html と合わせること)
+STREAM_ERROR_MARKER = "\n\u0000GENUI_STREAM_ERROR:"
+
+HTML_CONTEXT_LIMIT = 5000 # LLM に渡す現在の HTML の最大文字数
+HTML_REQUEST_LIMIT = 20000 # これを超える current_html はリクエストの検証段階で拒否する
+
+# ユーザープロンプトの雛形 (リクエストごとに組み立て直さない)
+_USER_PROMPT_TPL = """
+[User Action/Intent]: {action}
+
+[Current HTML Context]:
+```html
+{ctx}
+```
+
+Update the UI based on the user's action. Maintain consistent branding and layout.
+"""
+
+class UIRequest(BaseModel):
+    current_html: str = Field(default="", max_length=HTML_REQUEST_LIMIT)
+    user_action: str
+    api_key: str
+    system_prompt: str = ""
+    llm_url: str = ""
+    model: str = ""
+
+class _PrefixCORSMiddleware:
+    # 指定したパス以下のリクエストだけ CORSMiddleware を通す
+    def __init__(self, app, prefix, **options):
+        self.app = app
+        self.prefix = prefix
+        self.cors = CORSMiddleware(app, **options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.prefix):
+            await self.cors(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+@asynccontextmanager
+async def _lifespan(app):
+    # バックグラウンドタスクと HTTP クライアントの起動・停止
+    await start_history_flusher()
+    if LOG_GC_ENABLED:
+        await start_log_gc()
+    await start_aiohttp_session()
+    try:
+        yield
+    finally:
+        await stop_history_flusher()
+        await stop_log_gc()
+        await close_clients()
+
+def make_app(*, title, default_model, default_llm_url, default_system_prompt,
+             ping_message="GenUI Server is running", require_api_key=False):
+    """main.py / gemini_app.py 用の FastAPI アプリを組み立てる (既定値だけが異なる)"""
+    app = FastAPI(title=title, default_response_class=ORJSONResponse, lifespan=_lifespan)
+
+    # ブラウザから叩く API は /api 以下にまとめ、CORS は /api/ 以下だけに掛ける
+    # (サブアプリではなくルーターにして、/docs のスキーマを1つにまとめる)
+    api = APIRouter(prefix="/api")
+    app.add_middleware(
+        _PrefixCORSMiddleware,
+        prefix="/api/",
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    # フロントエンドが file:// から開かれていても履歴を復元できるよう、ログも CORS 付きで公開する
+    app.mount("/api/logs", StaticFiles(directory=LOG_DIR), name="api_logs")
+
+    app.mount("/logs", StaticFiles(directory=LOG_DIR), name="logs")
+
+    @app.get("/")
+    async def read_index():
+        return FileResponse("index.html")
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok", "message": ping_message}
+
+    @api.get("/history")
+    async def get_history():
+        return await load_history_async()
+
+    @api.get("/models")
+    async def get_models(llm_url: str = "", api_key: str = ""):
+        if not llm_url and not api_key:
+            raise HTTPException(status_code=400, detail="LLM URL or API Key is required.")
+
+        if llm_url:
+            llm_url = normalize_llm_url(llm_url)
+
+        cache_key = _models_cache_key(llm_url, api_key)
+        cached = _models_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return {"models": cached[1]}
+
+        try:
+            client = get_client(api_key, llm_url or None)
+            response = await client.models.list()
+            models = [m.id for m in response.data]
+            _models_cache.pop(cache_key, None)
+            if len(_models_cache) >= MODELS_CACHE_SIZE:
+                _models_cache.pop(next(iter(_models_cache)))
+            _models_cache[cache_key] = (time.monotonic() + MODELS_CACHE_TTL, models)
+            return {"models": models}
+        except Exception as e:
+            error_msg = str(e)
+            log.error("Error fetching models: %s", error_msg)
+            # URL関連のエラーなら詳細を返す
+            if "base_url" in error_msg or "URL" in error_msg or "404" in error_msg:
+                raise HTTPException(status_code=400, detail=f"Invalid LLM URL (Did you include /openai/ for Gemini?): {error_msg}")
+            raise HTTPException(status_code=500, detail=error_msg)
+
+    @api.post("/generate")
+    async def generate_ui(req: UIRequest):
+        if require_api_key and not req.api_key:
+            raise HTTPException(status_code=400, detail="API Key is required.")
+        llm_url = req.llm_url or default_llm_url
+        model = req.model or default_model
+        if not req.api_key and not llm_url:
+            raise HTTPException(status_code=400, detail="API Key or Local LLM URL is required.")
+
+        system_prompt = req.system_prompt if req.system_prompt else default_system_prompt
+
+        # 現在の HTML は先頭 HTML_CONTEXT_LIMIT 文字だけを文脈として渡す
+        html_context = req.current_html
+        if len(html_context) > HTML_CONTEXT_LIMIT:
+            html_context = html_context[:HTML_CONTEXT_LIMIT]
+
+        user_prompt = _USER_PROMPT_TPL.format(action=req.user_action, ctx=html_context)
+
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.4,
+        }
+        try:
+            deltas, close_stream = await open_chat_stream(req.api_key, llm_url, payload)
+        except Exception as e:
+            log.error("Error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+        # 生成された HTML は届いた順にそのままクライアントへ流す
+        async def stream_html():
+            chunks = []
+            try:
+                async for text in deltas:
+                    chunks.append(text)
+                    yield text
+
+                # クリーンアップ
+                generated_html = _FENCE_RE.sub("", "".join(chunks)).strip()
+
+                # --- ログ保存 & 履歴追加処理 ---
+                now = time.localtime()
+                timestamp = time.strftime("%H:%M:%S", now)
+                file_timestamp = time.strftime("%Y%m%d_%H%M%S", now)
+                # 同じ秒に複数のリクエスト (別ワーカーを含む) が完了しても上書きしないよう乱数を付ける
+                filename = f"ui_{file_timestamp}_{uuid.uuid4().hex[:8]}.html"
+                filepath = os.path.join(LOG_DIR, filename)
+
+                # ファイル保存 (イベントループを塞がないよう別スレッドで書き込む)
+                await asyncio.to_thread(_write_log, filepath, generated_html)
+
+                # 履歴 JSON に保存
+                save_history({
+                    "intent": req.user_action,
+                    "filename": filename,
+                    "time": timestamp,
+                    "model": model
+                })
+
+                log.info("[%s] Generated & Logged: %s", timestamp, filename)
+            except Exception as e:
+                # ストリーム開始後はステータスを変えられないので、末尾にエラーマーカーを付けて知らせる
+                log.error("Error: %s", e)
+                yield STREAM_ERROR_MARKER + str(e)
+            finally:
+                await close_stream() # 途中で切断された場合も接続を返却する
+
+        return StreamingResponse(stream_html(), media_type="text/plain")
+
+    app.include_router(api)
+    return app
+
+def run(app_path, port):
+    """uvloop + httptools で起動する (ワーカー数は GENUI_WORKERS で変更可、既定は1)"""
+    import uvicorn
+    workers = int(os.environ.get("GENUI_WORKERS", 1))
+    uvicorn.run(
+        app_path,
+        host="0.0.0.0",
+        port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop", # uvloop は Windows 非対応
+        http="httptools",
+        workers=workers,
+        log_level="info", # 起動時の "Uvicorn running on ..." は表示する
+        access_log=False, # リクエストごとのアクセスログは出さない
+    )